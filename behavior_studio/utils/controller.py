@@ -18,7 +18,6 @@ this program. If not, see <http://www.gnu.org/licenses/>.
 
 import shlex
 import subprocess
-import threading
 from datetime import datetime
 
 import rospy
@@ -30,6 +29,8 @@ __author__ = 'fqez'
 __contributors__ = []
 __license__ = 'GPLv3'
 
+ROSBAG_KILL_COMMAND = shlex.split("rosnode kill /behav_bag")
+
 
 class Controller:
     """This class defines the controller of the architecture, responsible of the communication between the logic (model)
@@ -44,12 +45,15 @@ class Controller:
 
     def __init__(self):
         """ Constructor of the class. """
-        pass
-        self.__data_loc = threading.Lock()
-        self.__pose_loc = threading.Lock()
+        # data and pose3D_data are written by the robot callbacks and read by the view without locking: a single
+        # dict item store/lookup and an attribute store are atomic under the GIL, and the view only needs the latest
+        # value, so a reader may see the previous frame but never a partially written one.
         self.data = {}
         self.pose3D_data = None
         self.recording = False
+        self.__gazebo_services = {}
+        self.__rosbag_logs = None
+        self.rosbag_proc = None
 
     # GUI update
     def update_frame(self, frame_id, data):
@@ -61,11 +65,7 @@ class Controller:
             frame_id {str} -- Identifier of the frame that will show the data
             data {dict} -- Data to be shown
         """
-        try:
-            with self.__data_loc:
-                self.data[frame_id] = data
-        except Exception as e:
-            logger.info(e)
+        self.data[frame_id] = data
 
     def get_data(self, frame_id):
         """Function to collect data retrieved by the robot for an specific frame of the GUI
@@ -78,14 +78,7 @@ class Controller:
         Returns:
             data -- Depending on the caller frame could be image data, laser data, etc.
         """
-        try:
-            with self.__data_loc:
-                data = self.data.get(frame_id, None)
-                # self.data[frame_id] = None
-        except Exception:
-            pass
-
-        return data
+        return self.data.get(frame_id, None)
 
     def update_pose3d(self, data):
         """Update the pose3D data retrieved from the robot
@@ -93,11 +86,7 @@ class Controller:
         Arguments:
             data {pose3d} -- 3D position of the robot in the environment
         """
-        try:
-            with self.__pose_loc:
-                self.pose3D_data = data
-        except Exception:
-            pass
+        self.pose3D_data = data
 
     def get_pose3D(self):
         """Function to collect the pose3D data updated in `update_pose3d` function.
@@ -111,29 +100,52 @@ class Controller:
 
     # Simulation and dataset
 
+    def call_gazebo_service(self, service):
+        """Call an empty gazebo service through a cached persistent proxy.
+
+        The proxy is created on first use and reused afterwards. If the connection was dropped (e.g. gazebo was
+        relaunched) the proxy is recreated and the call retried once.
+
+        Arguments:
+            service {str} -- Name of the service, e.g. /gazebo/pause_physics
+        """
+        proxy = self.__gazebo_services.get(service)
+        if proxy is not None:
+            try:
+                return proxy()
+            except rospy.ServiceException:
+                proxy.close()
+        proxy = rospy.ServiceProxy(service, Empty, persistent=True)
+        self.__gazebo_services[service] = proxy
+        return proxy()
+
     def reset_gazebo_simulation(self):
         logger.info("Restarting simulation")
-        reset_physics = rospy.ServiceProxy('/gazebo/reset_world', Empty)
-        reset_physics()
+        self.call_gazebo_service('/gazebo/reset_world')
 
     def pause_gazebo_simulation(self):
         logger.info("Pausing simulation")
-        pause_physics = rospy.ServiceProxy('/gazebo/pause_physics', Empty)
         try:
-            pause_physics()
+            self.call_gazebo_service('/gazebo/pause_physics')
         except Exception as ex:
             print(ex)
         self.pilot.stop_event.set()
 
     def unpause_gazebo_simulation(self):
         logger.info("Resuming simulation")
-        unpause_physics = rospy.ServiceProxy('/gazebo/unpause_physics', Empty)
         try:
-            unpause_physics()
+            self.call_gazebo_service('/gazebo/unpause_physics')
         except Exception as ex:
             print(ex)
         self.pilot.stop_event.clear()
 
+    def rosbag_logs(self):
+        """Return the (stdout, stderr) log files of the rosbag processes, opening them in append mode on first use."""
+        if self.__rosbag_logs is None:
+            self.__rosbag_logs = (open("logs/.roslaunch_stdout.log", "ab", 0),
+                                  open("logs/.roslaunch_stderr.log", "ab", 0))
+        return self.__rosbag_logs
+
     def record_rosbag(self, topics, dataset_name):
         """Start the recording process of the dataset using rosbags
 
@@ -147,8 +159,8 @@ class Controller:
             topics = ['/F1ROS/cmd_vel', '/F1ROS/cameraL/image_raw']
             command = "rosbag record -O " + dataset_name + " " + " ".join(topics) + " __name:=behav_bag"
             command = shlex.split(command)
-            with open("logs/.roslaunch_stdout.log", "w") as out, open("logs/.roslaunch_stderr.log", "w") as err:
-                self.rosbag_proc = subprocess.Popen(command, stdout=out, stderr=err)
+            out, err = self.rosbag_logs()
+            self.rosbag_proc = subprocess.Popen(command, stdout=out, stderr=err)
         else:
             logger.info("Rosbag already recording")
             self.stop_record()
@@ -158,10 +170,8 @@ class Controller:
         if self.rosbag_proc and self.recording:
             logger.info("Stopping bag recording")
             self.recording = False
-            command = "rosnode kill /behav_bag"
-            command = shlex.split(command)
-            with open("logs/.roslaunch_stdout.log", "w") as out, open("logs/.roslaunch_stderr.log", "w") as err:
-                subprocess.Popen(command, stdout=out, stderr=err)
+            out, err = self.rosbag_logs()
+            subprocess.Popen(ROSBAG_KILL_COMMAND, stdout=out, stderr=err)
         else:
             logger.info("No bag recording")
             
@@ -186,9 +196,9 @@ class Controller:
         self.record_stats = False
         timestr = time.strftime("%Y%m%d-%H%M%S")
         file_name = timestr + '_lap_checkpoints.pkl'
-        file_dump = open(self.stats_record_dir_path + '/' + file_name, 'wb')
         self.metrics['checkpoints'] = self.pilot.checkpoints
-        pickle.dump(self.metrics, file_dump)
+        with open(self.stats_record_dir_path + '/' + file_name, 'wb') as file_dump:
+            pickle.dump(self.metrics, file_dump, pickle.HIGHEST_PROTOCOL)
         print("Saved in: {}".format(self.stats_record_dir_path + file_name))
         
     def update_metrics(self):